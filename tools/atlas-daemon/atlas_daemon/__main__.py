@@ -5,6 +5,7 @@ import sys
 
 import click
 
+from . import atlas_cli
 from .bot import AtlasDaemonBot
 from .config import Config
 from .db import Database
@@ -52,12 +53,20 @@ def main(
     config.data_dir.mkdir(parents=True, exist_ok=True)
 
     init_encryption(config.encryption_key)
+    atlas_cli.set_subprocess_limit(config.max_concurrent_subprocesses)
 
     db = Database(config.data_dir / "atlas-daemon.db")
 
     import anthropic as anthropic_mod
+    import httpx
 
-    claude = anthropic_mod.AsyncAnthropic(api_key=config.anthropic_key)
+    # Reviews from many games can land at once; keep enough warm connections
+    # that they don't each pay a fresh TCP+TLS handshake.
+    http_client = anthropic_mod.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60),
+        timeout=httpx.Timeout(600.0, connect=10.0),
+    )
+    claude = anthropic_mod.AsyncAnthropic(api_key=config.anthropic_key, http_client=http_client)
 
     bot = AtlasDaemonBot(config, db, claude)
     bot.run(config.discord_token)
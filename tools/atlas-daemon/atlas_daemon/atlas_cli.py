@@ -7,21 +7,52 @@ from pathlib import Path
 log = logging.getLogger(__name__)
 
 
+MAX_DIFF_BYTES = 4 * 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+_subprocess_sem = asyncio.Semaphore(8)
+
+
+def set_subprocess_limit(limit: int) -> None:
+    global _subprocess_sem
+    _subprocess_sem = asyncio.Semaphore(max(1, limit))
+
+
 async def _run(
-    *cmd: str, cwd: Path | None = None, timeout: float = 300
+    *cmd: str,
+    cwd: Path | None = None,
+    timeout: float = 300,
+    max_bytes: int | None = None,
 ) -> tuple[str, str]:
-    proc = await asyncio.create_subprocess_exec(
-        *cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-        cwd=str(cwd) if cwd else None,
-    )
-    stdout_bytes, stderr_bytes = await asyncio.wait_for(
-        proc.communicate(), timeout=timeout
-    )
+    """Run a command and return its decoded (stdout, stderr).
+
+    At most ``set_subprocess_limit()`` commands run at once across all games.
+    With ``max_bytes`` set, stdout is read incrementally and the process is
+    killed once the limit is reached; the output is then cut at the limit and
+    ends with a truncation marker.
+    """
+    truncated = False
+    async with _subprocess_sem:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(cwd) if cwd else None,
+        )
+        async with asyncio.timeout(timeout):
+            if max_bytes is None:
+                stdout_bytes, stderr_bytes = await proc.communicate()
+            else:
+                stdout_bytes, stderr_bytes, truncated = await _communicate_capped(
+                    proc, max_bytes
+                )
     stdout = stdout_bytes.decode(errors="replace") if stdout_bytes else ""
     stderr = stderr_bytes.decode(errors="replace") if stderr_bytes else ""
 
+    if truncated:
+        log.warning("Output of %s truncated at %d bytes", cmd[0], max_bytes)
+        return f"{stdout}\n... [output truncated at {max_bytes} bytes]\n", stderr
+
     if proc.returncode != 0:
         raise RuntimeError(
             f"Command failed (exit {proc.returncode}): {' '.join(cmd)}\n{stderr}"
@@ -29,6 +60,29 @@ async def _run(
     return stdout, stderr
 
 
+async def _communicate_capped(
+    proc: asyncio.subprocess.Process, max_bytes: int
+) -> tuple[bytes, bytes, bool]:
+    assert proc.stdout is not None and proc.stderr is not None
+
+    async def read_stdout() -> tuple[bytes, bool]:
+        chunks: list[bytes] = []
+        size = 0
+        while chunk := await proc.stdout.read(READ_CHUNK_BYTES):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                proc.kill()
+                return b"".join(chunks)[:max_bytes], True
+        return b"".join(chunks), False
+
+    (stdout_bytes, truncated), stderr_bytes = await asyncio.gather(
+        read_stdout(), proc.stderr.read()
+    )
+    await proc.wait()
+    return stdout_bytes, stderr_bytes, truncated
+
+
 async def atlas_clone(
     atlas_binary: str,
     place_id: int,
@@ -82,20 +136,32 @@ async def git_add_all(cwd: Path) -> None:
 
 
 async def git_commit(cwd: Path, message: str) -> None:
-    await _run("git", "commit", "-m", message, "--allow-empty", cwd=cwd)
+    await _run(
+        "git", "-c", "commit.gpgsign=false",
+        "commit", "--no-verify", "-m", message, "--allow-empty",
+        cwd=cwd,
+    )
 
 
-async def git_diff(cwd: Path) -> str:
-    try:
-        stdout, _ = await _run("git", "diff", "HEAD", cwd=cwd)
-        return stdout
-    except RuntimeError:
-        return ""
+async def git_has_changes(cwd: Path) -> bool:
+    stdout, _ = await _run("git", "status", "--porcelain", "-z", cwd=cwd)
+    return bool(stdout)
 
 
-async def git_diff_name_only(cwd: Path) -> list[str]:
+async def git_diff(cwd: Path) -> tuple[str, list[str]]:
+    """Returns (patch, changed paths) from a single `git diff HEAD --raw --patch`."""
     try:
-        stdout, _ = await _run("git", "diff", "HEAD", "--name-only", cwd=cwd)
-        return [line.strip() for line in stdout.splitlines() if line.strip()]
+        stdout, _ = await _run(
+            "git", "diff", "HEAD", "--raw", "--patch", "--no-color",
+            cwd=cwd, max_bytes=MAX_DIFF_BYTES,
+        )
     except RuntimeError:
-        return []
+        return "", []
+
+    raw, _, patch = stdout.partition("\n\n")
+    changed_files = [
+        line.rsplit("\t", 1)[-1]
+        for line in raw.splitlines()
+        if line.startswith(":")
+    ]
+    return patch, changed_files
@@ -73,13 +73,9 @@ class AtlasDaemonBot(discord.Client):
                 return
 
             encrypted = security.encrypt_api_key(key)
-            for game in self.db.get_games_for_server(str(interaction.guild_id)):
-                if game.added_by == str(interaction.user.id):
-                    self.db._conn.execute(
-                        "UPDATE games SET api_key_encrypted = ? WHERE id = ?",
-                        (encrypted, game.id),
-                    )
-            self.db._conn.commit()
+            self.db.set_api_key_for_user(
+                str(interaction.guild_id), str(interaction.user.id), encrypted
+            )
             await interaction.response.send_message(
                 "API key updated for all your games in this server.", ephemeral=True
             )
@@ -124,7 +120,7 @@ class AtlasDaemonBot(discord.Client):
             user_games = [g for g in games if g.added_by == str(interaction.user.id)]
             api_key_encrypted: bytes | None = None
             if user_games:
-                api_key_encrypted = user_games[0].api_key_encrypted
+                api_key_encrypted = self.db.get_game_api_key(user_games[0].id)
 
             if api_key_encrypted is None:
                 await interaction.followup.send(
@@ -155,7 +151,7 @@ class AtlasDaemonBot(discord.Client):
 
             game = self.db.get_game(server_id, place_id)
             if game:
-                daemon.start_sync_loop(game, self.config, self.db, self, self.claude)
+                daemon.start_sync_loop(game, self.config, self.db, self)
 
             await interaction.followup.send(
                 f"Now monitoring PlaceId {place_id} in {target_channel.mention}. "
@@ -215,7 +211,9 @@ class AtlasDaemonBot(discord.Client):
                 shutil.rmtree(working_dir, ignore_errors=True)
 
             try:
-                opencloud_key = security.decrypt_api_key(game.api_key_encrypted)
+                opencloud_key = self.db.api_key_for(game.id)
+                if opencloud_key is None:
+                    raise RuntimeError("Game was removed")
                 await daemon.init_game(self.config, place_id, server_id, opencloud_key)
             except Exception as exc:
                 await interaction.followup.send(
@@ -223,18 +221,11 @@ class AtlasDaemonBot(discord.Client):
                 )
                 return
 
-            self.db._conn.execute(
-                "DELETE FROM issues WHERE game_id = ?", (game.id,)
-            )
-            self.db._conn.execute(
-                "UPDATE games SET last_sync_at = NULL, last_error = NULL, error_count = 0 WHERE id = ?",
-                (game.id,),
-            )
-            self.db._conn.commit()
+            self.db.reset_game_state(game.id)
 
             game = self.db.get_game(server_id, place_id)
             if game:
-                daemon.start_sync_loop(game, self.config, self.db, self, self.claude)
+                daemon.start_sync_loop(game, self.config, self.db, self)
 
             await interaction.followup.send(f"PlaceId {place_id} has been reset and re-synced.", ephemeral=True)
 
@@ -243,15 +234,17 @@ class AtlasDaemonBot(discord.Client):
             if not await self._check_server_async(interaction):
                 return
 
-            games = self.db.get_games_for_server(str(interaction.guild_id))
+            server_id = str(interaction.guild_id)
+            games = self.db.get_games_for_server(server_id)
             if not games:
                 await interaction.response.send_message("No games are being monitored in this server.", ephemeral=True)
                 return
 
+            unresolved_counts = self.db.count_unresolved_issues_for_server(server_id)
             lines = []
             for g in games:
                 status_icon = "🔴" if g.last_error else "🟢"
-                unresolved = len(self.db.get_unresolved_issues(g.id))
+                unresolved = unresolved_counts.get(g.id, 0)
                 lines.append(
                     f"{status_icon} **PlaceId {g.place_id}** -- "
                     f"Last sync: {g.last_sync_at or 'Never'} -- "
@@ -296,12 +289,18 @@ class AtlasDaemonBot(discord.Client):
             return False
         return True
 
+    async def close(self) -> None:
+        await super().close()
+        await self.claude.close()
+
     async def on_ready(self) -> None:
         log.info("Bot ready as %s", self.user)
         await self.tree.sync()
         log.info("Slash commands synced")
 
-        for game in self.db.get_all_games():
-            if self.db.is_server_allowed(game.discord_server_id):
-                daemon.start_sync_loop(game, self.config, self.db, self, self.claude)
-                log.info("Started sync loop for PlaceId %d", game.place_id)
+        daemon.start_review_workers(self.config, self.db, self, self.claude)
+
+        games = self.db.get_all_games_for_allowed_servers()
+        for game in games:
+            daemon.start_sync_loop(game, self.config, self.db, self)
+        log.info("Started %d sync loop(s)", len(games))
@@ -13,6 +13,8 @@ class Config:
     encryption_key: str = ""
     sync_interval: int = 300
     max_games_per_server: int = 5
+    max_concurrent_subprocesses: int = 8
+    review_workers: int = 4
     atlas_binary: str = "atlas"
 
     @classmethod
@@ -30,5 +32,7 @@ class Config:
             encryption_key=_get("ENCRYPTION_KEY"),
             sync_interval=int(_get("SYNC_INTERVAL", "300")),
             max_games_per_server=int(_get("MAX_GAMES_PER_SERVER", "5")),
+            max_concurrent_subprocesses=int(_get("MAX_CONCURRENT_SUBPROCESSES", "8")),
+            review_workers=int(_get("REVIEW_WORKERS", "4")),
             atlas_binary=_get("ATLAS_BINARY", "atlas"),
         )
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -9,15 +11,29 @@ from typing import TYPE_CHECKING
 import anthropic
 import discord
 
-from . import atlas_cli, discord_fmt, review, security
+from . import atlas_cli, discord_fmt, review
 
 if TYPE_CHECKING:
     from .config import Config
-    from .db import Database, Game
+    from .db import Database, DBIssue, Game
 
 log = logging.getLogger(__name__)
 
+REVIEW_QUEUE_SIZE = 64
+
+
+@dataclass
+class ReviewJob:
+    game: Game
+    diff: str
+    existing: list[DBIssue]
+    script_files: list[str]
+    auto_resolved_count: int
+
+
 _sync_tasks: dict[int, asyncio.Task[None]] = {}
+_review_queue: asyncio.Queue[ReviewJob] = asyncio.Queue(maxsize=REVIEW_QUEUE_SIZE)
+_review_workers: list[asyncio.Task[None]] = []
 
 
 async def init_game(
@@ -39,17 +55,31 @@ def start_sync_loop(
     config: Config,
     db: Database,
     bot: discord.Client,
-    claude: anthropic.AsyncAnthropic,
 ) -> None:
     if game.id in _sync_tasks and not _sync_tasks[game.id].done():
         return
 
     task = asyncio.create_task(
-        _sync_loop(game, config, db, bot, claude), name=f"sync-{game.place_id}"
+        _sync_loop(game, config, db, bot), name=f"sync-{game.place_id}"
     )
     _sync_tasks[game.id] = task
 
 
+def start_review_workers(
+    config: Config,
+    db: Database,
+    bot: discord.Client,
+    claude: anthropic.AsyncAnthropic,
+) -> None:
+    """Start the shared Claude review workers; later calls (e.g. on reconnect) are no-ops."""
+    if _review_workers:
+        return
+    for n in range(config.review_workers):
+        _review_workers.append(
+            asyncio.create_task(_review_worker(db, bot, claude), name=f"review-{n}")
+        )
+
+
 def stop_sync_loop(game_id: int) -> None:
     task = _sync_tasks.pop(game_id, None)
     if task and not task.done():
@@ -66,54 +96,63 @@ async def _sync_loop(
     config: Config,
     db: Database,
     bot: discord.Client,
-    claude: anthropic.AsyncAnthropic,
 ) -> None:
     await bot.wait_until_ready()
     log.info("Starting sync loop for PlaceId %d (server %s)", game.place_id, game.discord_server_id)
 
+    # Spread first cycles over the interval so loops started together don't stay aligned.
+    await asyncio.sleep(random.uniform(0, config.sync_interval))
+
     while True:
         try:
-            api_key = security.decrypt_api_key(game.api_key_encrypted)
+            api_key = await _get_api_key(db, game.id)
             working_dir = Path(game.working_dir)
 
             await atlas_cli.atlas_syncback(
                 config.atlas_binary, working_dir, game.place_id, api_key
             )
 
-            diff = await atlas_cli.git_diff(working_dir)
+            has_changes = await atlas_cli.git_has_changes(working_dir)
+            diff, changed_files = "", []
+            if has_changes:
+                diff, changed_files = await atlas_cli.git_diff(working_dir)
+
             if diff:
-                changed_files = await atlas_cli.git_diff_name_only(working_dir)
                 script_files = [
-                    f for f in changed_files
-                    if any(f.endswith(ext) for ext in review.REVIEWABLE_EXTENSIONS)
+                    f for f in changed_files if f.endswith(review.REVIEWABLE_EXTENSIONS)
                 ]
 
-                auto_resolved_ids = _auto_resolve(db, game.id, changed_files)
-                for rid in auto_resolved_ids:
-                    await _update_resolved_embed(bot, db, rid)
+                auto_resolved_ids = await db.a_resolve_issues_in_files(
+                    game.id, changed_files, resolved_by="auto", reason="file modified"
+                )
+                await asyncio.gather(
+                    *(_update_resolved_embed(bot, db, rid) for rid in auto_resolved_ids),
+                    return_exceptions=True,
+                )
 
                 if script_files:
-                    existing = db.get_unresolved_issues(game.id)
-                    try:
-                        issues = await review.review_diff(claude, diff, existing)
-                    except Exception as exc:
-                        _handle_error(db, bot, game, str(exc), "Claude API error")
-                        issues = []
-
-                    new_issues = [
-                        i for i in issues
-                        if not db.final_dedup(game.id, i.file, i.title)
-                    ]
-
-                    if new_issues:
-                        await _post_issues(bot, db, game, new_issues, diff, changed_files)
-
+                    # Review runs on the shared workers so a slow Claude response
+                    # doesn't hold up this game's commit and next cycle.
+                    await _review_queue.put(
+                        ReviewJob(
+                            game=game,
+                            diff=diff,
+                            existing=await db.a_get_unresolved_issues(game.id),
+                            script_files=script_files,
+                            auto_resolved_count=len(auto_resolved_ids),
+                        )
+                    )
+
+            # Commit whenever status reported something, including untracked-only
+            # changes that `git diff HEAD` doesn't show, so the next clean cycle
+            # can short-circuit on `git status`.
+            if has_changes:
                 await atlas_cli.git_add_all(working_dir)
                 await atlas_cli.git_commit(
                     working_dir,
                     f"Sync {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
                 )
-                db.update_last_sync(game.id)
+            await db.a_update_last_sync(game.id)
 
         except asyncio.CancelledError:
             log.info("Sync loop cancelled for PlaceId %d", game.place_id)
@@ -130,7 +169,7 @@ async def _sync_loop(
             elif "git" in error_str.lower():
                 error_type = "Git error"
 
-            should_report = db.update_last_error(game.id, error_str)
+            should_report = await db.a_update_last_error(game.id, error_str)
             if should_report:
                 await _send_error(bot, game, error_str, error_type)
 
@@ -139,91 +178,129 @@ async def _sync_loop(
         await asyncio.sleep(config.sync_interval)
 
 
-def _auto_resolve(db: Database, game_id: int, changed_files: list[str]) -> list[int]:
-    resolved_ids = []
-    for issue in db.get_unresolved_issues(game_id):
-        if issue.file_path in changed_files:
-            db.resolve_issue(issue.id, resolved_by="auto", reason="file modified")
-            resolved_ids.append(issue.id)
-    return resolved_ids
+async def _review_worker(
+    db: Database,
+    bot: discord.Client,
+    claude: anthropic.AsyncAnthropic,
+) -> None:
+    while True:
+        job = await _review_queue.get()
+        try:
+            await _run_review(db, bot, claude, job)
+        except Exception:
+            log.exception("Review failed for PlaceId %d", job.game.place_id)
+        finally:
+            _review_queue.task_done()
 
 
-async def _update_resolved_embed(bot: discord.Client, db: Database, issue_id: int) -> None:
-    from .db import DBIssue
+async def _run_review(
+    db: Database,
+    bot: discord.Client,
+    claude: anthropic.AsyncAnthropic,
+    job: ReviewJob,
+) -> None:
+    game = job.game
+    if game.id not in _sync_tasks:
+        # Removed (or being reset) while the job was queued.
+        return
 
-    row = db._conn.execute("SELECT * FROM issues WHERE id = ?", (issue_id,)).fetchone()
-    if not row:
+    try:
+        issues = await review.review_diff(claude, job.diff, job.existing)
+    except Exception as exc:
+        await _handle_error(db, bot, game, str(exc), "Claude API error")
         return
-    issue = DBIssue(*row)
-    if not issue.discord_message_id:
+
+    # Check before saving anything: stored issues that never get posted would
+    # still suppress the same findings in later reviews.
+    channel = bot.get_channel(int(game.channel_id))
+    if not channel or not isinstance(channel, discord.TextChannel):
+        log.warning("Channel %s not found for PlaceId %d", game.channel_id, game.place_id)
+        return
+
+    # Dedup and insert happen in one transaction, so a concurrent review of the
+    # same game can't post the same issue twice.
+    issue_db_ids = await db.a_add_new_issues(
+        game.id,
+        [
+            (i.file, i.line_start, i.line_end, i.severity, i.title, i.explanation, i.suggestion)
+            for i in issues
+        ],
+    )
+    new_issues = [
+        (issue, issue_db_id)
+        for issue, issue_db_id in zip(issues, issue_db_ids)
+        if issue_db_id is not None
+    ]
+
+    if new_issues:
+        await _post_issues(
+            channel, db, game, new_issues, job.diff, job.script_files, job.auto_resolved_count
+        )
+
+
+async def _get_api_key(db: Database, game_id: int) -> str:
+    # Database drops its cached key on /set-api-key, so changes apply next cycle.
+    api_key = await db.a_api_key_for(game_id)
+    if api_key is None:
+        raise RuntimeError(f"Game {game_id} no longer exists")
+    return api_key
+
+
+async def _update_resolved_embed(bot: discord.Client, db: Database, issue_id: int) -> None:
+    ref = await db.a_get_issue_message_ref(issue_id)
+    if not ref:
+        return
+    channel_id, message_id = ref
+
+    channel = bot.get_channel(int(channel_id))
+    if not channel or not isinstance(channel, discord.TextChannel):
         return
 
     try:
-        for guild in bot.guilds:
-            for channel in guild.text_channels:
-                try:
-                    msg = await channel.fetch_message(int(issue.discord_message_id))
-                    if msg.embeds:
-                        embed = msg.embeds[0]
-                        embed.set_footer(text="Resolved -- code was modified")
-                        embed.color = 0x95A5A6
-                        await msg.edit(embed=embed, view=None)
-                    return
-                except (discord.NotFound, discord.Forbidden):
-                    continue
+        msg = await channel.fetch_message(int(message_id))
+        if msg.embeds:
+            embed = msg.embeds[0]
+            embed.set_footer(text="Resolved -- code was modified")
+            embed.color = 0x95A5A6
+            await msg.edit(embed=embed, view=None)
     except Exception:
         log.debug("Could not update resolved embed for issue %d", issue_id)
 
 
 async def _post_issues(
-    bot: discord.Client,
+    channel: discord.TextChannel,
     db: Database,
     game: Game,
-    issues: list[review.Issue],
+    new_issues: list[tuple[review.Issue, int]],
     diff: str,
-    changed_files: list[str],
+    script_files: list[str],
+    auto_resolved_count: int,
 ) -> None:
-    channel = bot.get_channel(int(game.channel_id))
-    if not channel or not isinstance(channel, discord.TextChannel):
-        log.warning("Channel %s not found for PlaceId %d", game.channel_id, game.place_id)
-        return
+    issues = [issue for issue, _ in new_issues]
 
     lines_added, lines_removed = discord_fmt.count_diff_lines(diff)
-    script_files = [
-        f for f in changed_files
-        if any(f.endswith(ext) for ext in review.REVIEWABLE_EXTENSIONS)
-    ]
-
-    auto_resolved_count = len([
-        i for i in db.get_unresolved_issues(game.id)
-    ])
 
     summary = discord_fmt.make_summary_embed(
-        game.place_id, issues, 0, script_files, lines_added, lines_removed
+        game.place_id, issues, auto_resolved_count, script_files, lines_added, lines_removed
     )
 
     has_critical = any(i.severity == "Critical" for i in issues)
     content = "@here" if has_critical else None
 
-    await channel.send(content=content, embed=summary)
-
-    for issue in issues:
-        embed = discord_fmt.make_issue_embed(issue)
-        issue_db_id = db.add_issue(
-            game_id=game.id,
-            discord_message_id=None,
-            file_path=issue.file,
-            line_start=issue.line_start,
-            line_end=issue.line_end,
-            severity=issue.severity,
-            title=issue.title,
-            explanation=issue.explanation,
-            suggestion=issue.suggestion,
-        )
-
-        view = discord_fmt.IssueButtons(issue_db_id)
-        msg = await channel.send(embed=embed, view=view)
-        db.update_issue_message_id(issue_db_id, str(msg.id))
+    message_ids: list[tuple[int, str]] = []
+    try:
+        await channel.send(content=content, embed=summary)
+        for issue, issue_db_id in new_issues:
+            embed = discord_fmt.make_issue_embed(issue)
+            view = discord_fmt.IssueButtons(issue_db_id)
+            msg = await channel.send(embed=embed, view=view)
+            message_ids.append((issue_db_id, str(msg.id)))
+    finally:
+        # Drop issues whose message never went out, so a later review can
+        # report them again instead of having them deduped away.
+        posted = {issue_db_id for issue_db_id, _ in message_ids}
+        unposted = [issue_db_id for _, issue_db_id in new_issues if issue_db_id not in posted]
+        await db.a_finish_issue_posts(message_ids, unposted)
 
 
 async def _send_error(
@@ -239,13 +316,13 @@ async def _send_error(
     await channel.send(embed=embed)
 
 
-def _handle_error(
+async def _handle_error(
     db: Database,
     bot: discord.Client,
     game: Game,
     error: str,
     error_type: str,
 ) -> None:
-    should_report = db.update_last_error(game.id, error)
+    should_report = await db.a_update_last_error(game.id, error)
     if should_report:
-        asyncio.create_task(_send_error(bot, game, error, error_type))
+        await _send_error(bot, game, error, error_type)
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import queue
 import sqlite3
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from pathlib import Path
+from typing import ParamSpec, TypeVar
+
+from . import security
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
 
 GLOBAL_ADMIN_IDS = ["176643682689089545", "1010301288946339920"]
+STATEMENT_CACHE_SIZE = 256
+READER_COUNT = 4
 
 SCHEMA = """\
 CREATE TABLE IF NOT EXISTS allowed_servers (
@@ -55,6 +69,8 @@ CREATE TABLE IF NOT EXISTS issues (
 );
 
 CREATE INDEX IF NOT EXISTS idx_issues_game_unresolved ON issues(game_id, resolved);
+CREATE INDEX IF NOT EXISTS idx_issues_dedup ON issues(game_id, file_path, title) WHERE resolved = 0;
+CREATE INDEX IF NOT EXISTS idx_issues_message ON issues(discord_message_id);
 CREATE INDEX IF NOT EXISTS idx_games_server ON games(discord_server_id);
 """
 
@@ -65,7 +81,6 @@ class Game:
     discord_server_id: str
     place_id: int
     channel_id: str
-    api_key_encrypted: bytes
     added_by: str
     working_dir: str
     last_sync_at: str | None
@@ -94,50 +109,160 @@ class DBIssue:
     created_at: str
 
 
+# Explicit column lists so rows map onto the dataclasses by name, and so game
+# reads skip the api_key_encrypted blob (see get_game_api_key).
+_GAME_COLUMNS = ", ".join(f.name for f in fields(Game))
+_ISSUE_COLUMNS = ", ".join(f.name for f in fields(DBIssue))
+
+
 class Database:
+    """One writer connection plus a pool of read-only ones; WAL lets reads proceed during writes."""
+
     def __init__(self, db_path: Path) -> None:
         db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
-        self._conn.execute("PRAGMA journal_mode=WAL")
-        self._conn.execute("PRAGMA foreign_keys=ON")
-        self._conn.executescript(SCHEMA)
+        self._writer = self._connect(str(db_path))
+        self._write_lock = threading.RLock()
+        self._in_transaction = False
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        # Under WAL, NORMAL only fsyncs at checkpoints: still crash-safe, but a
+        # power loss can drop the most recent commits.
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        self._writer.execute("PRAGMA foreign_keys=ON")
+        self._writer.executescript(SCHEMA)
         self._seed_admins()
 
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        reader_uri = f"{db_path.resolve().as_uri()}?mode=ro"
+        for _ in range(READER_COUNT):
+            reader = self._connect(reader_uri, uri=True)
+            reader.execute("PRAGMA query_only=ON")
+            self._readers.put(reader)
+
+        # Coroutines use the a_* wrappers, which run on these threads so sqlite
+        # I/O never blocks the event loop. One write thread matches the single
+        # writer connection; reads get one thread per pooled connection.
+        self._write_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-write")
+        self._read_exec = ThreadPoolExecutor(
+            max_workers=READER_COUNT, thread_name_prefix="db-read"
+        )
+
+        # Permission checks run on every interaction; serve them from memory.
+        self._cache_lock = threading.Lock()
+        self._admin_ids: set[str] = {
+            r[0] for r in self._writer.execute("SELECT discord_user_id FROM admins")
+        }
+        self._allowed_servers: set[str] = {
+            r[0] for r in self._writer.execute("SELECT discord_server_id FROM allowed_servers")
+        }
+
+        # Decrypted OpenCloud keys by game id, filled on first use. Every write
+        # to api_key_encrypted drops the affected entries and bumps the
+        # generation, so a lookup that raced with one doesn't cache a stale key.
+        self._api_keys: dict[int, str] = {}
+        self._api_key_generation = 0
+
+    @staticmethod
+    def _connect(database: str, uri: bool = False) -> sqlite3.Connection:
+        # sqlite3 reuses prepared statements keyed by SQL text; every query here is
+        # a constant literal, so size the cache to keep all of them resident.
+        conn = sqlite3.connect(
+            database, uri=uri, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Commits every write made inside the block at once, or none of them.
+
+        Holds the writer for the whole block, so do not await inside it. Reads
+        inside the block go to the reader pool and don't see its pending writes.
+        """
+        with self._write_lock:
+            if self._in_transaction:
+                yield
+                return
+            self._in_transaction = True
+            try:
+                # IMMEDIATE takes the write lock up front instead of on the first write.
+                self._writer.execute("BEGIN IMMEDIATE")
+                try:
+                    yield
+                except BaseException:
+                    self._writer.rollback()
+                    raise
+                self._writer.commit()
+            finally:
+                self._in_transaction = False
+
+    async def _on_writer(
+        self, fn: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs
+    ) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._write_exec, functools.partial(fn, *args, **kwargs))
+
+    async def _on_reader(
+        self, fn: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs
+    ) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_exec, functools.partial(fn, *args, **kwargs))
+
+    def _bulk_insert(self, sql: str, rows: list[tuple[object, ...]]) -> None:
+        with self.transaction():
+            self._writer.executemany(sql, rows)
+
     def _seed_admins(self) -> None:
-        for uid in GLOBAL_ADMIN_IDS:
-            self._conn.execute(
-                "INSERT OR IGNORE INTO admins (discord_user_id) VALUES (?)", (uid,)
-            )
-        self._conn.commit()
+        self._bulk_insert(
+            "INSERT OR IGNORE INTO admins (discord_user_id) VALUES (?)",
+            [(uid,) for uid in GLOBAL_ADMIN_IDS],
+        )
 
     def is_admin(self, user_id: str) -> bool:
-        row = self._conn.execute(
-            "SELECT 1 FROM admins WHERE discord_user_id = ?", (user_id,)
-        ).fetchone()
-        return row is not None
+        return user_id in self._admin_ids
 
     # -- Server whitelist --
 
     def is_server_allowed(self, server_id: str) -> bool:
-        row = self._conn.execute(
-            "SELECT 1 FROM allowed_servers WHERE discord_server_id = ?", (server_id,)
-        ).fetchone()
-        return row is not None
+        return server_id in self._allowed_servers
 
     def approve_server(
         self, server_id: str, server_name: str | None, approved_by: str
     ) -> None:
-        self._conn.execute(
-            "INSERT OR REPLACE INTO allowed_servers (discord_server_id, server_name, approved_by) VALUES (?, ?, ?)",
-            (server_id, server_name, approved_by),
-        )
-        self._conn.commit()
+        with self.transaction():
+            self._writer.execute(
+                "INSERT OR REPLACE INTO allowed_servers (discord_server_id, server_name, approved_by) VALUES (?, ?, ?)",
+                (server_id, server_name, approved_by),
+            )
+        with self._cache_lock:
+            self._allowed_servers.add(server_id)
 
     def revoke_server(self, server_id: str) -> None:
-        self._conn.execute(
-            "DELETE FROM allowed_servers WHERE discord_server_id = ?", (server_id,)
-        )
-        self._conn.commit()
+        with self.transaction():
+            # The server's games go with it (ON DELETE CASCADE).
+            game_ids = [
+                r[0]
+                for r in self._writer.execute(
+                    "SELECT id FROM games WHERE discord_server_id = ?", (server_id,)
+                )
+            ]
+            self._writer.execute(
+                "DELETE FROM allowed_servers WHERE discord_server_id = ?", (server_id,)
+            )
+        with self._cache_lock:
+            self._allowed_servers.discard(server_id)
+        self._forget_api_keys(game_ids)
 
     # -- Games --
 
@@ -150,131 +275,300 @@ class Database:
         added_by: str,
         working_dir: str,
     ) -> int:
-        cur = self._conn.execute(
-            "INSERT INTO games (discord_server_id, place_id, channel_id, api_key_encrypted, added_by, working_dir) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (server_id, place_id, channel_id, api_key_encrypted, added_by, working_dir),
-        )
-        self._conn.commit()
-        return cur.lastrowid  # type: ignore[return-value]
+        with self.transaction():
+            cur = self._writer.execute(
+                "INSERT INTO games (discord_server_id, place_id, channel_id, api_key_encrypted, added_by, working_dir) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (server_id, place_id, channel_id, api_key_encrypted, added_by, working_dir),
+            )
+        game_id: int = cur.lastrowid  # type: ignore[assignment]
+        self._forget_api_keys([game_id])
+        return game_id
 
     def remove_game(self, server_id: str, place_id: int) -> bool:
-        cur = self._conn.execute(
-            "DELETE FROM games WHERE discord_server_id = ? AND place_id = ?",
-            (server_id, place_id),
-        )
-        self._conn.commit()
-        return cur.rowcount > 0
+        with self.transaction():
+            rows = self._writer.execute(
+                "DELETE FROM games WHERE discord_server_id = ? AND place_id = ? RETURNING id",
+                (server_id, place_id),
+            ).fetchall()
+        self._forget_api_keys([r[0] for r in rows])
+        return bool(rows)
+
+    def set_api_key_for_user(
+        self, server_id: str, user_id: str, api_key_encrypted: bytes
+    ) -> None:
+        with self.transaction():
+            rows = self._writer.execute(
+                "UPDATE games SET api_key_encrypted = ? WHERE discord_server_id = ? AND added_by = ? RETURNING id",
+                (api_key_encrypted, server_id, user_id),
+            ).fetchall()
+        self._forget_api_keys([r[0] for r in rows])
+
+    def _forget_api_keys(self, game_ids: list[int]) -> None:
+        with self._cache_lock:
+            self._api_key_generation += 1
+            for game_id in game_ids:
+                self._api_keys.pop(game_id, None)
+
+    def api_key_for(self, game_id: int) -> str | None:
+        """Returns the game's decrypted OpenCloud key, or None if the game is gone."""
+        with self._cache_lock:
+            api_key = self._api_keys.get(game_id)
+            generation = self._api_key_generation
+        if api_key is not None:
+            return api_key
+        api_key_encrypted = self.get_game_api_key(game_id)
+        if api_key_encrypted is None:
+            return None
+        api_key = security.decrypt_api_key(api_key_encrypted)
+        with self._cache_lock:
+            if self._api_key_generation == generation:
+                self._api_keys[game_id] = api_key
+        return api_key
+
+    def reset_game_state(self, game_id: int) -> None:
+        """Drops all issues for the game and clears its sync/error state."""
+        with self.transaction():
+            self._writer.execute("DELETE FROM issues WHERE game_id = ?", (game_id,))
+            self._writer.execute(
+                "UPDATE games SET last_sync_at = NULL, last_error = NULL, error_count = 0 WHERE id = ?",
+                (game_id,),
+            )
 
     def get_game(self, server_id: str, place_id: int) -> Game | None:
-        row = self._conn.execute(
-            "SELECT * FROM games WHERE discord_server_id = ? AND place_id = ?",
-            (server_id, place_id),
-        ).fetchone()
-        return Game(*row) if row else None
+        with self._reader() as conn:
+            row = conn.execute(
+                f"SELECT {_GAME_COLUMNS} FROM games WHERE discord_server_id = ? AND place_id = ?",
+                (server_id, place_id),
+            ).fetchone()
+        return Game(**row) if row else None
+
+    def get_game_api_key(self, game_id: int) -> bytes | None:
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT api_key_encrypted FROM games WHERE id = ?", (game_id,)
+            ).fetchone()
+        return row[0] if row else None
 
     def get_games_for_server(self, server_id: str) -> list[Game]:
-        rows = self._conn.execute(
-            "SELECT * FROM games WHERE discord_server_id = ?", (server_id,)
-        ).fetchall()
-        return [Game(*r) for r in rows]
-
-    def get_all_games(self) -> list[Game]:
-        rows = self._conn.execute("SELECT * FROM games").fetchall()
-        return [Game(*r) for r in rows]
+        with self._reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_GAME_COLUMNS} FROM games WHERE discord_server_id = ?", (server_id,)
+            ).fetchall()
+        return [Game(**r) for r in rows]
+
+    def get_all_games_for_allowed_servers(self) -> list[Game]:
+        with self._reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_GAME_COLUMNS} FROM games "
+                "WHERE discord_server_id IN (SELECT discord_server_id FROM allowed_servers)"
+            ).fetchall()
+        return [Game(**r) for r in rows]
 
     def count_games_for_server(self, server_id: str) -> int:
-        row = self._conn.execute(
-            "SELECT COUNT(*) FROM games WHERE discord_server_id = ?", (server_id,)
-        ).fetchone()
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM games WHERE discord_server_id = ?", (server_id,)
+            ).fetchone()
         return row[0] if row else 0
 
     def update_last_sync(self, game_id: int) -> None:
-        now = datetime.now(timezone.utc).isoformat()
-        self._conn.execute(
-            "UPDATE games SET last_sync_at = ?, last_error = NULL, last_error_at = NULL, error_count = 0 WHERE id = ?",
-            (now, game_id),
-        )
-        self._conn.commit()
+        with self.transaction():
+            self._writer.execute(
+                "UPDATE games SET last_sync_at = datetime('now'), last_error = NULL, last_error_at = NULL, "
+                "error_count = 0 WHERE id = ?",
+                (game_id,),
+            )
 
     def update_last_error(self, game_id: int, error: str) -> bool:
         """Update error state. Returns True if this is a new error or throttle window expired."""
-        row = self._conn.execute(
-            "SELECT last_error, error_count FROM games WHERE id = ?", (game_id,)
-        ).fetchone()
-
-        now = datetime.now(timezone.utc).isoformat()
-        if row and row[0] == error:
-            new_count = (row[1] or 0) + 1
-            self._conn.execute(
-                "UPDATE games SET error_count = ? WHERE id = ?",
-                (new_count, game_id),
-            )
-            self._conn.commit()
-            return new_count == 1 or new_count % 12 == 0
-        else:
-            self._conn.execute(
-                "UPDATE games SET last_error = ?, last_error_at = ?, error_count = 1 WHERE id = ?",
-                (error, now, game_id),
-            )
-            self._conn.commit()
+        # SET expressions all see the pre-update row, so `last_error = :error`
+        # compares against the previous error.
+        with self.transaction():
+            row = self._writer.execute(
+                "UPDATE games SET "
+                "error_count = CASE WHEN last_error = :error THEN COALESCE(error_count, 0) + 1 ELSE 1 END, "
+                "last_error_at = CASE WHEN last_error = :error THEN last_error_at ELSE datetime('now') END, "
+                "last_error = :error "
+                "WHERE id = :id RETURNING error_count",
+                {"error": error, "id": game_id},
+            ).fetchone()
+        if row is None:
             return True
+        new_count = row[0]
+        return new_count == 1 or new_count % 12 == 0
 
     # -- Issues --
 
     def get_unresolved_issues(self, game_id: int) -> list[DBIssue]:
-        rows = self._conn.execute(
-            "SELECT * FROM issues WHERE game_id = ? AND resolved = 0", (game_id,)
-        ).fetchall()
-        return [DBIssue(*r) for r in rows]
+        with self._reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_ISSUE_COLUMNS} FROM issues WHERE game_id = ? AND resolved = 0", (game_id,)
+            ).fetchall()
+        return [DBIssue(**r) for r in rows]
+
+    def count_unresolved_issues_for_server(self, server_id: str) -> dict[int, int]:
+        """Returns unresolved issue counts keyed by game id; games with none are omitted."""
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT i.game_id, COUNT(*) FROM issues i JOIN games g ON g.id = i.game_id "
+                "WHERE g.discord_server_id = ? AND i.resolved = 0 GROUP BY i.game_id",
+                (server_id,),
+            ).fetchall()
+        return {r[0]: r[1] for r in rows}
+
+    def add_issues_bulk(
+        self,
+        game_id: int,
+        rows: list[tuple[str, int | None, int | None, str, str, str | None, str | None]],
+    ) -> list[int]:
+        """Inserts (file_path, line_start, line_end, severity, title, explanation,
+        suggestion) rows in one transaction and returns their ids in order."""
+        if not rows:
+            return []
+        with self.transaction():
+            self._writer.executemany(
+                "INSERT INTO issues (game_id, file_path, line_start, line_end, "
+                "severity, title, explanation, suggestion) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(game_id, *row) for row in rows],
+            )
+            # AUTOINCREMENT hands out consecutive ids while we hold the write lock.
+            (last_id,) = self._writer.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'issues'"
+            ).fetchone()
+        return list(range(last_id - len(rows) + 1, last_id + 1))
 
-    def add_issue(
+    def add_new_issues(
         self,
         game_id: int,
-        discord_message_id: str | None,
-        file_path: str,
-        line_start: int | None,
-        line_end: int | None,
-        severity: str,
-        title: str,
-        explanation: str | None,
-        suggestion: str | None,
-    ) -> int:
-        cur = self._conn.execute(
-            "INSERT INTO issues (game_id, discord_message_id, file_path, line_start, line_end, "
-            "severity, title, explanation, suggestion) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (game_id, discord_message_id, file_path, line_start, line_end, severity, title, explanation, suggestion),
-        )
-        self._conn.commit()
-        return cur.lastrowid  # type: ignore[return-value]
+        rows: list[tuple[str, int | None, int | None, str, str, str | None, str | None]],
+    ) -> list[int | None]:
+        """Like add_issues_bulk, but skips rows whose (file_path, title) is already
+        unresolved for the game. Returns ids aligned with rows, None where skipped.
+
+        The check and the insert share one transaction, so concurrent callers
+        can't both insert the same issue.
+        """
+        with self.transaction():
+            existing = {
+                (r[0], r[1])
+                for r in self._writer.execute(
+                    "SELECT file_path, title FROM issues INDEXED BY idx_issues_dedup "
+                    "WHERE game_id = ? AND resolved = 0",
+                    (game_id,),
+                )
+            }
+            fresh: list[int] = []
+            for n, row in enumerate(rows):
+                if (row[0], row[4]) not in existing:
+                    fresh.append(n)
+            new_ids = iter(self.add_issues_bulk(game_id, [rows[n] for n in fresh]))
+        fresh_set = set(fresh)
+        return [next(new_ids) if n in fresh_set else None for n in range(len(rows))]
 
     def resolve_issue(
         self, issue_id: int, resolved_by: str, reason: str = "manual"
     ) -> None:
-        now = datetime.now(timezone.utc).isoformat()
-        self._conn.execute(
-            "UPDATE issues SET resolved = 1, resolved_by = ?, resolved_reason = ?, resolved_at = ? WHERE id = ?",
-            (resolved_by, reason, now, issue_id),
-        )
-        self._conn.commit()
+        with self.transaction():
+            self._writer.execute(
+                "UPDATE issues SET resolved = 1, resolved_by = ?, resolved_reason = ?, resolved_at = datetime('now') "
+                "WHERE id = ?",
+                (resolved_by, reason, issue_id),
+            )
 
-    def update_issue_message_id(self, issue_id: int, message_id: str) -> None:
-        self._conn.execute(
-            "UPDATE issues SET discord_message_id = ? WHERE id = ?",
-            (message_id, issue_id),
-        )
-        self._conn.commit()
+    def resolve_issues_in_files(
+        self, game_id: int, file_paths: list[str], resolved_by: str, reason: str
+    ) -> list[int]:
+        """Resolves the game's unresolved issues in any of file_paths; returns their ids."""
+        paths = set(file_paths)
+        with self.transaction():
+            ids = [
+                r[0]
+                for r in self._writer.execute(
+                    "SELECT id, file_path FROM issues WHERE game_id = ? AND resolved = 0",
+                    (game_id,),
+                )
+                if r[1] in paths
+            ]
+            self._writer.executemany(
+                "UPDATE issues SET resolved = 1, resolved_by = ?, resolved_reason = ?, resolved_at = datetime('now') "
+                "WHERE id = ?",
+                [(resolved_by, reason, issue_id) for issue_id in ids],
+            )
+        return ids
+
+    def finish_issue_posts(
+        self, message_ids: list[tuple[int, str]], unposted_ids: list[int]
+    ) -> None:
+        """Records the Discord message for each (issue_id, message_id) pair and
+        deletes the issues in unposted_ids, whose messages were never sent."""
+        with self.transaction():
+            self._writer.executemany(
+                "UPDATE issues SET discord_message_id = ? WHERE id = ?",
+                [(message_id, issue_id) for issue_id, message_id in message_ids],
+            )
+            self._writer.executemany(
+                "DELETE FROM issues WHERE id = ?", [(issue_id,) for issue_id in unposted_ids]
+            )
 
     def get_issue_by_message_id(self, message_id: str) -> DBIssue | None:
-        row = self._conn.execute(
-            "SELECT * FROM issues WHERE discord_message_id = ?", (message_id,)
-        ).fetchone()
-        return DBIssue(*row) if row else None
-
-    def final_dedup(self, game_id: int, file_path: str, title: str) -> bool:
-        """Returns True if this (file, title) pair already exists as unresolved."""
-        row = self._conn.execute(
-            "SELECT 1 FROM issues WHERE game_id = ? AND file_path = ? AND title = ? AND resolved = 0",
-            (game_id, file_path, title),
-        ).fetchone()
-        return row is not None
+        with self._reader() as conn:
+            row = conn.execute(
+                f"SELECT {_ISSUE_COLUMNS} FROM issues WHERE discord_message_id = ?", (message_id,)
+            ).fetchone()
+        return DBIssue(**row) if row else None
+
+    def get_issue_message_ref(self, issue_id: int) -> tuple[str, str] | None:
+        """Returns (channel_id, discord_message_id) for an issue that was posted."""
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT g.channel_id, i.discord_message_id FROM issues i "
+                "JOIN games g ON g.id = i.game_id "
+                "WHERE i.id = ? AND i.discord_message_id IS NOT NULL",
+                (issue_id,),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    # -- Async wrappers for use from the event loop --
+
+    async def a_api_key_for(self, game_id: int) -> str | None:
+        return await self._on_reader(self.api_key_for, game_id)
+
+    async def a_update_last_sync(self, game_id: int) -> None:
+        await self._on_writer(self.update_last_sync, game_id)
+
+    async def a_update_last_error(self, game_id: int, error: str) -> bool:
+        return await self._on_writer(self.update_last_error, game_id, error)
+
+    async def a_get_unresolved_issues(self, game_id: int) -> list[DBIssue]:
+        return await self._on_reader(self.get_unresolved_issues, game_id)
+
+    async def a_add_new_issues(
+        self,
+        game_id: int,
+        rows: list[tuple[str, int | None, int | None, str, str, str | None, str | None]],
+    ) -> list[int | None]:
+        return await self._on_writer(self.add_new_issues, game_id, rows)
+
+    async def a_resolve_issue(
+        self, issue_id: int, resolved_by: str, reason: str = "manual"
+    ) -> None:
+        await self._on_writer(self.resolve_issue, issue_id, resolved_by, reason)
+
+    async def a_resolve_issues_in_files(
+        self, game_id: int, file_paths: list[str], resolved_by: str, reason: str
+    ) -> list[int]:
+        return await self._on_writer(
+            self.resolve_issues_in_files, game_id, file_paths, resolved_by, reason
+        )
+
+    async def a_finish_issue_posts(
+        self, message_ids: list[tuple[int, str]], unposted_ids: list[int]
+    ) -> None:
+        await self._on_writer(self.finish_issue_posts, message_ids, unposted_ids)
+
+    async def a_get_issue_by_message_id(self, message_id: str) -> DBIssue | None:
+        return await self._on_reader(self.get_issue_by_message_id, message_id)
+
+    async def a_get_issue_message_ref(self, issue_id: int) -> tuple[str, str] | None:
+        return await self._on_reader(self.get_issue_message_ref, issue_id)
@@ -110,7 +110,7 @@ class IssueButtons(discord.ui.View):
             await interaction.response.send_message("Database not available.", ephemeral=True)
             return
 
-        _bot_ref.db.resolve_issue(self.issue_db_id, resolved_by=str(interaction.user.id))
+        await _bot_ref.db.a_resolve_issue(self.issue_db_id, resolved_by=str(interaction.user.id))
 
         embed = interaction.message.embeds[0] if interaction.message and interaction.message.embeds else None
         if embed:
@@ -128,7 +128,7 @@ class IssueButtons(discord.ui.View):
             await interaction.response.send_message("Database not available.", ephemeral=True)
             return
 
-        issue = _bot_ref.db.get_issue_by_message_id(str(interaction.message.id)) if interaction.message else None
+        issue = await _bot_ref.db.a_get_issue_by_message_id(str(interaction.message.id)) if interaction.message else None
         if not issue:
             await interaction.response.send_message("Issue not found.", ephemeral=True)
             return
@@ -148,11 +148,9 @@ class IssueButtons(discord.ui.View):
 
 
 def count_diff_lines(diff: str) -> tuple[int, int]:
-    added = 0
-    removed = 0
-    for line in diff.splitlines():
-        if line.startswith("+") and not line.startswith("+++"):
-            added += 1
-        elif line.startswith("-") and not line.startswith("---"):
-            removed += 1
+    # Count line starts with str.count instead of looping over lines in Python;
+    # the leading newline lets the first line match too.
+    text = "\n" + diff
+    added = text.count("\n+") - text.count("\n+++")
+    removed = text.count("\n-") - text.count("\n---")
     return added, removed
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import re
@@ -18,6 +19,11 @@ log = logging.getLogger(__name__)
 REVIEWABLE_EXTENSIONS = (".luau", ".lua")
 TOKEN_ESTIMATE_DIVISOR = 4
 MAX_SINGLE_PASS_TOKENS = 150_000
+MAX_CONCURRENT_CHUNK_REVIEWS = 8
+
+_FENCE_HEAD = re.compile(r"^```\w*\n?")
+_FENCE_TAIL = re.compile(r"\n?```$")
+_JSON_ARRAY = re.compile(r"\[.*\]", re.DOTALL)
 
 
 @dataclass
@@ -31,44 +37,38 @@ class Issue:
     suggestion: str
 
 
+@functools.lru_cache(maxsize=1)
 def _load_system_prompt() -> str:
     return resources.files("atlas_daemon").joinpath("review_prompt.txt").read_text()
 
 
-def split_diff_by_file(raw_diff: str) -> list[str]:
-    chunks: list[str] = []
+def filter_script_changes(raw_diff: str) -> list[str]:
+    # Single pass: a file's `+++` header decides whether its lines are kept, so
+    # skipped files are never buffered or re-scanned.
+    filtered: list[str] = []
     current: list[str] = []
+    keep = False
+    have_path = False
 
     for line in raw_diff.splitlines(keepends=True):
         if line.startswith("diff --git "):
-            if current:
-                chunks.append("".join(current))
+            if keep:
+                filtered.append("".join(current))
             current = [line]
-        else:
+            keep = have_path = False
+        elif not have_path:
+            if line.startswith("+++ "):
+                path = line[6:] if line.startswith("+++ b/") else line[4:]
+                keep = path.strip().endswith(REVIEWABLE_EXTENSIONS)
+                have_path = True
+            current.append(line)
+        elif keep:
             current.append(line)
 
-    if current:
-        chunks.append("".join(current))
-
-    return chunks
-
-
-def extract_file_path(file_diff: str) -> str:
-    for line in file_diff.splitlines():
-        if line.startswith("+++ b/"):
-            return line[6:].strip()
-        if line.startswith("+++ "):
-            return line[4:].strip()
-    return ""
-
+    if keep:
+        filtered.append("".join(current))
 
-def filter_script_changes(raw_diff: str) -> str:
-    filtered = []
-    for chunk in split_diff_by_file(raw_diff):
-        path = extract_file_path(chunk)
-        if any(path.endswith(ext) for ext in REVIEWABLE_EXTENSIONS):
-            filtered.append(chunk)
-    return "\n".join(filtered)
+    return filtered
 
 
 def format_existing_issues(existing: list[DBIssue]) -> str:
@@ -81,24 +81,12 @@ def format_existing_issues(existing: list[DBIssue]) -> str:
 
 
 def parse_issues(text: str) -> list[Issue]:
-    text = text.strip()
-    if text.startswith("```"):
-        text = re.sub(r"^```\w*\n?", "", text)
-        text = re.sub(r"\n?```$", "", text)
-        text = text.strip()
-
+    # The prompt asks for a bare JSON array, so try that before any cleanup.
     try:
         data = json.loads(text)
     except json.JSONDecodeError:
-        match = re.search(r"\[.*\]", text, re.DOTALL)
-        if match:
-            try:
-                data = json.loads(match.group())
-            except json.JSONDecodeError:
-                log.warning("Could not parse review response as JSON")
-                return []
-        else:
-            log.warning("No JSON array found in review response")
+        data = _parse_wrapped_json(text)
+        if data is None:
             return []
 
     if not isinstance(data, list):
@@ -126,29 +114,58 @@ def parse_issues(text: str) -> list[Issue]:
     return issues
 
 
+def _parse_wrapped_json(text: str) -> object | None:
+    """Fallback for responses that fence the array or surround it with prose."""
+    if "[" not in text:
+        log.warning("No JSON array found in review response")
+        return None
+
+    text = text.strip()
+    if text.startswith("```"):
+        text = _FENCE_HEAD.sub("", text)
+        text = _FENCE_TAIL.sub("", text)
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+
+    match = _JSON_ARRAY.search(text)
+    if not match:
+        log.warning("No JSON array found in review response")
+        return None
+    try:
+        return json.loads(match.group())
+    except json.JSONDecodeError:
+        log.warning("Could not parse review response as JSON")
+        return None
+
+
 async def review_diff(
     client: anthropic.AsyncAnthropic,
     diff: str,
     existing_issues: list[DBIssue],
 ) -> list[Issue]:
-    script_diff = filter_script_changes(diff)
-    if not script_diff:
+    file_diffs = filter_script_changes(diff)
+    if not file_diffs:
         return []
 
     existing_context = format_existing_issues(existing_issues)
+    prefix = f"{existing_context}\n\nReview this diff:\n\n" if existing_context else "Review this diff:\n\n"
 
-    token_estimate = len(script_diff) // TOKEN_ESTIMATE_DIVISOR
+    # Size of the joined diff, without building it for the chunked path.
+    diff_len = sum(map(len, file_diffs)) + len(file_diffs) - 1
+    token_estimate = diff_len // TOKEN_ESTIMATE_DIVISOR
     if token_estimate > MAX_SINGLE_PASS_TOKENS:
-        return await _review_chunked(client, script_diff, existing_context)
+        return await _review_chunked(client, file_diffs, prefix)
 
-    user_content = f"{existing_context}\n\nReview this diff:\n\n{script_diff}" if existing_context else f"Review this diff:\n\n{script_diff}"
+    script_diff = "\n".join(file_diffs)
 
     try:
         response = await client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=4096,
             system=_load_system_prompt(),
-            messages=[{"role": "user", "content": user_content}],
+            messages=[{"role": "user", "content": prefix + script_diff}],
         )
         return parse_issues(response.content[0].text)
     except Exception:
@@ -158,24 +175,22 @@ async def review_diff(
 
 async def _review_chunked(
     client: anthropic.AsyncAnthropic,
-    diff: str,
-    existing_context: str,
+    file_diffs: list[str],
+    prefix: str,
 ) -> list[Issue]:
-    file_diffs = split_diff_by_file(diff)
-    file_diffs = [
-        fd for fd in file_diffs
-        if any(extract_file_path(fd).endswith(ext) for ext in REVIEWABLE_EXTENSIONS)
-    ]
+    # A diff touching hundreds of scripts would otherwise open one request per
+    # file at once and run into API rate limits.
+    sem = asyncio.Semaphore(MAX_CONCURRENT_CHUNK_REVIEWS)
 
     async def review_one(file_diff: str) -> list[Issue]:
-        user_content = f"{existing_context}\n\nReview this diff:\n\n{file_diff}" if existing_context else f"Review this diff:\n\n{file_diff}"
         try:
-            response = await client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                system=_load_system_prompt(),
-                messages=[{"role": "user", "content": user_content}],
-            )
+            async with sem:
+                response = await client.messages.create(
+                    model="claude-sonnet-4-20250514",
+                    max_tokens=4096,
+                    system=_load_system_prompt(),
+                    messages=[{"role": "user", "content": prefix + file_diff}],
+                )
             return parse_issues(response.content[0].text)
         except Exception:
             log.exception("Claude API call failed for chunked review")
@@ -1,32 +1,59 @@
 from __future__ import annotations
 
+import base64
+import functools
+import hashlib
+import os
+
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
-_fernet: Fernet | None = None
+# Blobs written by encrypt_api_key are AESGCM_VERSION + nonce + ciphertext/tag.
+# Older blobs are Fernet tokens, which always start with 0x80.
+AESGCM_VERSION = b"\x01"
+NONCE_BYTES = 12
 
 
-def init_encryption(key: str) -> None:
-    global _fernet
-    if not key:
-        _fernet = Fernet(Fernet.generate_key())
-        return
+def _ciphers(master: bytes) -> tuple[AESGCM, Fernet]:
+    aes_key = HKDF(
+        algorithm=hashes.SHA256(), length=32, salt=None, info=b"atlas-daemon api key"
+    ).derive(master)
+    return AESGCM(aes_key), Fernet(base64.urlsafe_b64encode(master))
+
+
+@functools.lru_cache(maxsize=1)
+def _ciphers_for_key(key: str) -> tuple[AESGCM, Fernet]:
     if len(key) == 44 and key.endswith("="):
-        _fernet = Fernet(key.encode())
-    else:
-        import base64
-        import hashlib
+        return _ciphers(base64.urlsafe_b64decode(key))
+    return _ciphers(hashlib.sha256(key.encode()).digest())
+
+
+def init_encryption(key: str) -> None:
+    """Binds encrypt_api_key/decrypt_api_key to the ciphers for ``key``."""
+    global encrypt_api_key, decrypt_api_key
+    aesgcm, fernet = _ciphers_for_key(key) if key else _ciphers(os.urandom(32))
+    aes_encrypt, aes_decrypt, fernet_decrypt = aesgcm.encrypt, aesgcm.decrypt, fernet.decrypt
+    body_start = len(AESGCM_VERSION) + NONCE_BYTES
+
+    def _encrypt(plaintext: str) -> bytes:
+        nonce = os.urandom(NONCE_BYTES)
+        return AESGCM_VERSION + nonce + aes_encrypt(nonce, plaintext.encode(), None)
+
+    def _decrypt(ciphertext: bytes) -> str:
+        if ciphertext[:1] == AESGCM_VERSION:
+            nonce = ciphertext[len(AESGCM_VERSION):body_start]
+            return aes_decrypt(nonce, ciphertext[body_start:], None).decode()
+        return fernet_decrypt(ciphertext).decode()
 
-        derived = hashlib.sha256(key.encode()).digest()
-        _fernet = Fernet(base64.urlsafe_b64encode(derived))
+    encrypt_api_key, decrypt_api_key = _encrypt, _decrypt
 
 
+# Replaced by init_encryption(); these only run if it was never called.
 def encrypt_api_key(plaintext: str) -> bytes:
-    if _fernet is None:
-        raise RuntimeError("Encryption not initialized. Call init_encryption() first.")
-    return _fernet.encrypt(plaintext.encode())
+    raise RuntimeError("Encryption not initialized. Call init_encryption() first.")
 
 
 def decrypt_api_key(ciphertext: bytes) -> str:
-    if _fernet is None:
-        raise RuntimeError("Encryption not initialized. Call init_encryption() first.")
-    return _fernet.decrypt(ciphertext).decode()
+    raise RuntimeError("Encryption not initialized. Call init_encryption() first.")